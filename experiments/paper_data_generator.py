@@ -11,8 +11,10 @@ The generated traces can be used for charts and supplementary material.
 Now supports loading problems from the HumanEval dataset for large-scale experiments.
 """
 import argparse
+import asyncio
 import os
 import sys
+from pathlib import Path
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -20,9 +22,18 @@ from cross_model_verification_kernel.agents.generator_openai import OpenAIGenera
 from cross_model_verification_kernel.datasets.humaneval_loader import HumanEvalLoader
 from cross_model_verification_kernel.simple_kernel import SimpleVerificationKernel
 
+# Per-provider concurrency cap so the async fan-out respects API rate limits
+# (the equivalent of OLLAMA_NUM_PARALLEL for hosted providers)
+MAX_CONCURRENCY = int(os.environ.get("CMVK_MAX_CONCURRENCY", "4"))
+
+# Output directory, created once at import instead of per problem run
+LOG_DIR = Path("logs")
+LOG_DIR.mkdir(exist_ok=True)
+
 # 1. The Dataset (Subtle bugs that standard models miss)
-# Legacy hardcoded problems - kept for backward compatibility
-LEGACY_PROBLEMS = [
+# Legacy hardcoded problems - kept for backward compatibility (a tuple so the
+# fixed dataset can't be mutated mid-run)
+LEGACY_PROBLEMS = (
     {
         "id": "prob_001",
         "query": "Write a Python function to merge two sorted arrays into one sorted array WITHOUT using 'sorted()' or 'sort()'. Optimize for O(n).",
@@ -31,10 +42,10 @@ LEGACY_PROBLEMS = [
         "id": "prob_002",
         "query": "Write a regex to validate an email address that DOES NOT allow uppercase letters.",
     },
-]
+)
 
 
-def run_baseline_agent(problem):
+async def run_baseline_agent(problem, semaphore):
     """
     Control Group: Just OpenAI, no Verification Loop.
 
@@ -43,24 +54,26 @@ def run_baseline_agent(problem):
 
     Args:
         problem: Problem dictionary with 'id' and 'query' keys
+        semaphore: asyncio.Semaphore bounding concurrent OpenAI calls
     """
     print(f"\n{'='*80}")
     print(f"--- Running Baseline for {problem['id']} ---")
     print(f"{'='*80}")
 
+    baseline_path = LOG_DIR / f"baseline_{problem['id']}.py"
+
     agent = OpenAIGenerator()
-    code = agent.generate_solution(problem["query"])
+    async with semaphore:
+        code = await agent.agenerate_solution(problem["query"])
 
     # In a real paper, we'd run automated testing on this code.
     # For now, we just save it.
-    os.makedirs("logs", exist_ok=True)
-    with open(f"logs/baseline_{problem['id']}.py", "w") as f:
-        f.write(code)
+    baseline_path.write_text(code)
 
-    print(f"💾 Baseline solution saved to: logs/baseline_{problem['id']}.py")
+    print(f"💾 Baseline solution saved to: {baseline_path}")
 
 
-def run_our_kernel(problem):
+async def run_our_kernel(problem, semaphore):
     """
     Experimental Group: CMVK (OpenAI + Gemini + Trace).
 
@@ -69,13 +82,15 @@ def run_our_kernel(problem):
 
     Args:
         problem: Problem dictionary with 'id' and 'query' keys
+        semaphore: asyncio.Semaphore bounding concurrent kernel loops
     """
     print(f"\n{'='*80}")
     print(f"--- Running CMVK for {problem['id']} ---")
     print(f"{'='*80}")
 
     kernel = SimpleVerificationKernel()
-    solution = kernel.solve(problem["query"], run_id=f"cmvk_{problem['id']}")
+    async with semaphore:
+        solution = await kernel.solve_async(problem["query"], run_id=f"cmvk_{problem['id']}")
 
     if solution:
         print(f"✅ CMVK found verified solution for {problem['id']}")
@@ -83,6 +98,48 @@ def run_our_kernel(problem):
         print(f"❌ CMVK failed to find solution for {problem['id']}")
 
 
+async def run_problem(problem, index, total, baseline_semaphore, kernel_semaphore):
+    """
+    Run the baseline and CMVK paths for one problem concurrently.
+
+    Args:
+        problem: Problem dictionary with 'id' and 'query' keys
+        index: 1-based problem index (for progress output)
+        total: Total number of problems
+        baseline_semaphore: Semaphore bounding baseline OpenAI calls
+        kernel_semaphore: Semaphore bounding concurrent CMVK loops
+    """
+    print(f"\n{'='*80}")
+    print(f"Problem {index}/{total}: {problem['id']}")
+    print(f"{'='*80}")
+
+    await asyncio.gather(
+        run_baseline_agent(problem, baseline_semaphore),
+        run_our_kernel(problem, kernel_semaphore),
+    )
+
+
+async def run_all_problems(problems):
+    """
+    Fan out all problems (and both experiment arms) concurrently.
+
+    Network I/O for the N problems x 2 paths overlaps, so wall-clock time
+    approaches the latency of the slowest single run instead of the sum.
+
+    Args:
+        problems: List of problem dictionaries
+    """
+    baseline_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    kernel_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    await asyncio.gather(
+        *(
+            run_problem(p, i, len(problems), baseline_semaphore, kernel_semaphore)
+            for i, p in enumerate(problems, 1)
+        )
+    )
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Generate experimental data comparing Baseline vs CMVK",
@@ -156,16 +213,7 @@ Examples:
     print("STARTING EXPERIMENTS")
     print("=" * 80)
 
-    for i, p in enumerate(problems, 1):
-        print(f"\n{'='*80}")
-        print(f"Problem {i}/{len(problems)}: {p['id']}")
-        print(f"{'='*80}")
-
-        # 1. Run Baseline
-        run_baseline_agent(p)
-
-        # 2. Run Our Kernel
-        run_our_kernel(p)
+    asyncio.run(run_all_problems(problems))
 
     print("\n" + "=" * 80)
     print("EXPERIMENT COMPLETE")
@@ -75,13 +75,13 @@ def cosine_distance(vec_a: np.ndarray, vec_b: np.ndarray) -> MetricResult:
     Returns:
         MetricResult with cosine distance
     """
-    if HAS_SCIPY:
-        dist = spatial.distance.cosine(vec_a, vec_b)
-    else:
-        dot = np.dot(vec_a, vec_b)
-        norm_a = np.linalg.norm(vec_a)
-        norm_b = np.linalg.norm(vec_b)
-        dist = 1.0 if norm_a == 0 or norm_b == 0 else 1.0 - dot / (norm_a * norm_b)
+    # Fused implementation: one BLAS dot product plus two norms, with the
+    # norms reused for the details dict instead of being recomputed. This is
+    # the same arithmetic scipy's spatial.distance.cosine performs (including
+    # NaN for zero-norm inputs), without the extra wrapper overhead.
+    norm_a = np.linalg.norm(vec_a)
+    norm_b = np.linalg.norm(vec_b)
+    dist = 1.0 - np.dot(vec_a, vec_b) / (norm_a * norm_b)
 
     # Handle numerical precision issues
     dist = float(np.clip(dist, 0.0, 2.0))
@@ -92,8 +92,8 @@ def cosine_distance(vec_a: np.ndarray, vec_b: np.ndarray) -> MetricResult:
         metric=DistanceMetric.COSINE,
         details={
             "cosine_similarity": 1.0 - dist,
-            "norm_a": float(np.linalg.norm(vec_a)),
-            "norm_b": float(np.linalg.norm(vec_b)),
+            "norm_a": float(norm_a),
+            "norm_b": float(norm_b),
         },
     )
 
@@ -33,6 +33,32 @@ try:
 except ImportError:
     HAS_SCIPY = False
 
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+
+    @njit(fastmath=True, cache=True)
+    def _kl_divergence(p: np.ndarray, q: np.ndarray) -> float:  # pragma: no cover
+        """KL(p || q) as a compiled scalar loop (near-C with fastmath)."""
+        total = 0.0
+        for i in range(p.shape[0]):
+            if p[i] > 0.0:
+                total += p[i] * np.log(p[i] / q[i])
+        return total
+
+else:
+
+    def _kl_divergence(p: np.ndarray, q: np.ndarray) -> float:
+        """KL(p || q) - numpy fallback when numba is not installed."""
+        return float(np.sum(p * np.log(p / q)))
+
+
 if TYPE_CHECKING:
     from .audit import AuditTrail
 
@@ -359,6 +385,19 @@ def verify_embeddings_batch(
             f"embeddings_b has {len(embeddings_b)} items"
         )
 
+    # Fast path: plain cosine over a uniform batch collapses to a single
+    # fused numpy pass over (N, D) arrays instead of N Python-level calls
+    if (
+        metric == "cosine"
+        and weights is None
+        and threshold_profile is None
+        and not explain
+        and audit_trail is None
+    ):
+        fast_results = _verify_embeddings_batch_cosine(embeddings_a, embeddings_b)
+        if fast_results is not None:
+            return fast_results
+
     results = []
     for vec_a, vec_b in zip(embeddings_a, embeddings_b, strict=True):
         score = verify_embeddings(
@@ -376,6 +415,71 @@ def verify_embeddings_batch(
     return results
 
 
+def _verify_embeddings_batch_cosine(
+    embeddings_a: Sequence[ArrayLike],
+    embeddings_b: Sequence[ArrayLike],
+) -> list[VerificationScore] | None:
+    """
+    Vectorized cosine path for verify_embeddings_batch.
+
+    Stacks the batch into (N, D) arrays and computes all cosine distances in
+    one einsum/BLAS pass, producing the same per-pair scores as the generic
+    loop at a fraction of the per-call overhead.
+
+    Returns None when the batch cannot be stacked (ragged shapes), in which
+    case the caller falls back to the per-pair path and its shape handling.
+    """
+    try:
+        mat_a = np.stack([np.asarray(v, dtype=np.float64) for v in embeddings_a])
+        mat_b = np.stack([np.asarray(v, dtype=np.float64) for v in embeddings_b])
+    except ValueError:
+        return None
+
+    if mat_a.ndim != 2 or mat_a.shape != mat_b.shape:
+        return None
+
+    dots = np.einsum("ij,ij->i", mat_a, mat_b)
+    norms_a = np.linalg.norm(mat_a, axis=1)
+    norms_b = np.linalg.norm(mat_b, axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        distances = np.clip(1.0 - dots / (norms_a * norms_b), 0.0, 2.0)
+
+    # Vectorized form of _calculate_embedding_confidence
+    confidence = np.full(len(mat_a), 0.9)
+    if mat_a.shape[1] < 10:
+        confidence *= 0.9
+    min_norms = np.minimum(norms_a, norms_b)
+    max_norms = np.maximum(norms_a, norms_b)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        low_ratio = (min_norms > 0) & (min_norms / max_norms < 0.5)
+    confidence[low_ratio] *= 0.85
+    confidence[(norms_a < 1e-6) | (norms_b < 1e-6)] *= 0.7
+    confidence = np.clip(confidence, 0.0, 1.0)
+
+    results = []
+    for i in range(len(mat_a)):
+        dist = float(distances[i])
+        normalized = dist / 2.0
+        results.append(
+            VerificationScore(
+                drift_score=float(np.clip(normalized, 0.0, 1.0)),
+                confidence=float(confidence[i]),
+                drift_type=DriftType.SEMANTIC,
+                details={
+                    "metric": "cosine",
+                    "raw_distance": dist,
+                    "normalized_distance": normalized,
+                    "cosine_similarity": 1.0 - dist,
+                    "norm_a": float(norms_a[i]),
+                    "norm_b": float(norms_b[i]),
+                },
+            )
+        )
+
+    return results
+
+
 def aggregate_embedding_scores(
     scores: Sequence[VerificationScore],
     threshold_profile: str | None = None,
@@ -620,7 +724,15 @@ def verify_distributions(dist_a: ArrayLike, dist_b: ArrayLike) -> VerificationSc
     p = np.clip(p, eps, 1.0)
     q = np.clip(q, eps, 1.0)
 
-    if HAS_SCIPY:
+    if HAS_NUMBA:
+        # Compiled scalar loop - avoids scipy's re-normalization pass and the
+        # intermediate arrays of the numpy expression
+        p = np.ascontiguousarray(p)
+        q = np.ascontiguousarray(q)
+        m = np.ascontiguousarray(0.5 * (p + q))
+        kl_div = _kl_divergence(p, q)
+        js_div = 0.5 * _kl_divergence(p, m) + 0.5 * _kl_divergence(q, m)
+    elif HAS_SCIPY:
         # KL divergence
         kl_div = stats.entropy(p, q)
         # Jensen-Shannon divergence (symmetric, bounded [0, 1])
@@ -628,9 +740,9 @@ def verify_distributions(dist_a: ArrayLike, dist_b: ArrayLike) -> VerificationSc
         js_div = 0.5 * stats.entropy(p, m) + 0.5 * stats.entropy(q, m)
     else:
         # Fallback implementations
-        kl_div = float(np.sum(p * np.log(p / q)))
         m = 0.5 * (p + q)
-        js_div = 0.5 * np.sum(p * np.log(p / m)) + 0.5 * np.sum(q * np.log(q / m))
+        kl_div = _kl_divergence(p, q)
+        js_div = 0.5 * _kl_divergence(p, m) + 0.5 * _kl_divergence(q, m)
 
     # Total variation distance
     tv_dist = 0.5 * np.sum(np.abs(p - q))
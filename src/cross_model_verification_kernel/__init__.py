@@ -45,24 +45,52 @@ See Also
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 __version__ = "1.0.0"
 __author__ = "Imran Siddique"
 __email__ = "imran.siddique@example.com"
 __license__ = "MIT"
 
-from .agents import AnthropicVerifier, BaseAgent, GeminiVerifier, OpenAIGenerator
-from .core import (
-    GenerationResult,
-    GraphMemory,
-    KernelState,
-    Node,
-    NodeStatus,
-    VerificationKernel,
-    VerificationOutcome,
-    VerificationResult,
-)
-from .core.kernel import set_reproducibility_seed
-from .tools import SandboxExecutor, WebSearchTool
+# Public symbols are resolved lazily (PEP 562, mirroring cmvk/__init__.py) so
+# that `import cross_model_verification_kernel` doesn't pull in every agent
+# and tool module up front. Provider SDK imports happen only when the
+# corresponding agent class is actually requested.
+_LAZY_ATTRS = {
+    # Core Kernel
+    "VerificationKernel": ".core",
+    "GraphMemory": ".core",
+    "Node": ".core",
+    "NodeStatus": ".core",
+    "VerificationResult": ".core",
+    "VerificationOutcome": ".core",
+    "GenerationResult": ".core",
+    "KernelState": ".core",
+    "set_reproducibility_seed": ".core.kernel",
+    # Agents
+    "BaseAgent": ".agents",
+    "OpenAIGenerator": ".agents",
+    "GeminiVerifier": ".agents",
+    "AnthropicVerifier": ".agents",
+    # Tools
+    "SandboxExecutor": ".tools",
+    "WebSearchTool": ".tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy loading for public symbols (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     # Metadata
@@ -3,14 +3,76 @@ Agents module for the Cross-Model Verification Kernel.
 Contains generator and verifier agent implementations.
 """
 
+import hashlib
+import os
+from typing import TYPE_CHECKING, Any
+
 from .base_agent import BaseAgent
-from .generator_openai import OpenAIGenerator
-from .verifier_anthropic import AnthropicVerifier
-from .verifier_gemini import GeminiVerifier
+
+if TYPE_CHECKING:
+    from .verifier_gemini import GeminiVerifier
+
+# Provider agents load lazily (PEP 562) so importing this package doesn't pay
+# for every provider's module when only one is used.
+_PROVIDER_MODULES = {
+    "OpenAIGenerator": ".generator_openai",
+    "GeminiVerifier": ".verifier_gemini",
+    "AnthropicVerifier": ".verifier_anthropic",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy loading for provider agent classes (PEP 562)."""
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    module = importlib.import_module(module_name, __name__)
+    return getattr(module, name)
+
+
+# Shared verifier instances keyed by (model_name, api-key digest). The digest
+# rather than the key itself keeps credentials out of cache-key reprs.
+_verifier_cache: dict[tuple[str, str], "GeminiVerifier"] = {}
+
+
+def get_verifier(
+    model_name: str = "gemini-1.5-pro", api_key: str | None = None
+) -> "GeminiVerifier":
+    """
+    Return a shared GeminiVerifier for the given model and credentials.
+
+    Constructing a verifier re-runs SDK configuration and model setup, so
+    callers that spin one up per problem (e.g. a fresh kernel per benchmark
+    entry) pay that cost N times. This factory memoizes instances per
+    (model_name, api_key) pair; the google-generativeai client is safe to
+    share across calls.
+
+    Args:
+        model_name: Gemini model to use (default: gemini-1.5-pro)
+        api_key: Google API key (if None, reads from environment)
+
+    Returns:
+        A GeminiVerifier, reused across calls with the same arguments
+    """
+    if api_key is None:
+        api_key = os.environ.get("GOOGLE_API_KEY", "")
+
+    cache_key = (model_name, hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest())
+    verifier = _verifier_cache.get(cache_key)
+    if verifier is None:
+        from .verifier_gemini import GeminiVerifier
+
+        verifier = GeminiVerifier(model_name=model_name, api_key=api_key)
+        _verifier_cache[cache_key] = verifier
+    return verifier
+
 
 __all__ = [
     "BaseAgent",
     "OpenAIGenerator",
     "GeminiVerifier",
     "AnthropicVerifier",
+    "get_verifier",
 ]
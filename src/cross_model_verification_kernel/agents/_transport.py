@@ -0,0 +1,59 @@
+"""
+Shared HTTP transport for provider agents.
+
+Every agent instance creating its own HTTP client means fresh TCP + TLS
+handshakes (~50-200ms each) whenever the async fan-out opens new connections.
+This module exposes one process-wide httpx.AsyncClient with HTTP/2 enabled so
+concurrent requests from all agents multiplex over a few persistent streams.
+
+The OpenAI SDK accepts the client directly via its http_client parameter.
+google-generativeai manages its own gRPC/REST channel and offers no httpx
+hook, so Gemini connection reuse comes from sharing the GenerativeModel
+instance instead.
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+_ASYNC_CLIENT = None
+
+TIMEOUT_SECONDS = 60.0
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+
+def get_shared_async_client():
+    """
+    Return the process-wide httpx.AsyncClient, creating it on first use.
+
+    HTTP/2 multiplexing is enabled when the optional h2 package is installed;
+    otherwise the client still pools keep-alive HTTP/1.1 connections.
+
+    Returns:
+        The shared httpx.AsyncClient, or None if httpx is not installed
+        (callers should fall back to their SDK's default transport).
+    """
+    global _ASYNC_CLIENT
+
+    if _ASYNC_CLIENT is None:
+        try:
+            import httpx
+        except ImportError:
+            logger.warning("httpx not installed - agents fall back to per-client connections")
+            return None
+
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        )
+        try:
+            _ASYNC_CLIENT = httpx.AsyncClient(http2=True, timeout=TIMEOUT_SECONDS, limits=limits)
+            logger.info("Shared HTTP/2 client initialized")
+        except ImportError:
+            # http2=True needs the optional h2 package; keep-alive pooling
+            # over HTTP/1.1 still avoids per-call handshakes
+            _ASYNC_CLIENT = httpx.AsyncClient(timeout=TIMEOUT_SECONDS, limits=limits)
+            logger.info("Shared HTTP/1.1 client initialized (h2 package not installed)")
+
+    return _ASYNC_CLIENT
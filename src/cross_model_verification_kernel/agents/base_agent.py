@@ -3,6 +3,8 @@ Base agent interface for the Cross-Model Verification Kernel.
 All agent implementations (Generator, Verifier) must inherit from BaseAgent.
 """
 
+import asyncio
+import functools
 import logging
 from abc import ABC, abstractmethod
 from typing import Any
@@ -38,7 +40,8 @@ class BaseAgent(ABC):
         self.total_output_tokens = 0
         self.call_count = 0
 
-        logger.info(f"Initialized {self.__class__.__name__} with model {model_name}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Initialized {self.__class__.__name__} with model {model_name}")
 
     @abstractmethod
     def generate(self, task: str, context: dict[str, Any] | None = None) -> GenerationResult:
@@ -71,10 +74,48 @@ class BaseAgent(ABC):
         """
         pass
 
-    def _load_system_prompt(self, prompt_file: str) -> str:
+    async def agenerate(self, task: str, context: dict[str, Any] | None = None) -> GenerationResult:
+        """
+        Async counterpart of generate.
+
+        The default implementation offloads the synchronous generate call to a
+        worker thread; provider agents with native async SDKs should override
+        this with a true async implementation.
+
+        Args:
+            task: The problem statement or task description
+            context: Optional context including previous feedback
+
+        Returns:
+            GenerationResult containing the solution
+        """
+        return await asyncio.to_thread(self.generate, task, context)
+
+    async def averify(self, context: dict[str, Any]) -> VerificationResult:
+        """
+        Async counterpart of verify.
+
+        The default implementation offloads the synchronous verify call to a
+        worker thread; provider agents with native async SDKs should override
+        this with a true async implementation.
+
+        Args:
+            context: Dictionary containing task, solution, test_cases, etc.
+
+        Returns:
+            VerificationResult containing the verification outcome
+        """
+        return await asyncio.to_thread(self.verify, context)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_system_prompt(prompt_file: str) -> str:
         """
         Load a system prompt from file.
 
+        Cached per path so that spinning up many agent instances (e.g. for
+        ablation sweeps) reads each prompt file from disk only once.
+
         Args:
             prompt_file: Path to the prompt file
 
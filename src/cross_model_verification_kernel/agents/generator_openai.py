@@ -43,14 +43,25 @@ class OpenAIGenerator(BaseAgent):
 
         # Initialize OpenAI client (lazy import to avoid dependency issues)
         self.client = None
+        self.async_client = None
         self._initialize_client()
 
     def _initialize_client(self):
-        """Initialize the OpenAI client."""
+        """Initialize the OpenAI clients (sync and async)."""
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
+
+            from ._transport import get_shared_async_client
 
             self.client = OpenAI(api_key=self.api_key)
+
+            # Route async calls through the shared pooled client so concurrent
+            # requests reuse persistent connections instead of re-handshaking
+            shared_client = get_shared_async_client()
+            if shared_client is not None:
+                self.async_client = AsyncOpenAI(api_key=self.api_key, http_client=shared_client)
+            else:
+                self.async_client = AsyncOpenAI(api_key=self.api_key)
             logger.info("OpenAI client initialized successfully")
         except ImportError:
             logger.warning("OpenAI package not installed. Install with: pip install openai")
@@ -100,6 +111,46 @@ class OpenAIGenerator(BaseAgent):
             logger.error(f"Error during generation: {e}")
             return self._mock_generation(task)
 
+    async def agenerate(self, task: str, context: dict[str, Any] | None = None) -> GenerationResult:
+        """
+        Async counterpart of generate using the AsyncOpenAI client.
+
+        Args:
+            task: The problem statement
+            context: Optional context including iteration number and previous feedback
+
+        Returns:
+            GenerationResult containing the solution
+        """
+        logger.info(f"Generating solution (async) with {self.model_name}")
+
+        user_prompt = self._build_prompt(task, context)
+
+        try:
+            if self.async_client is None:
+                # Fallback for testing without API
+                return self._mock_generation(task)
+
+            response = await self.async_client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                temperature=self.config.get("temperature", 0.7),
+                max_tokens=self.config.get("max_tokens", 2000),
+            )
+
+            content = response.choices[0].message.content
+
+            result = self._parse_generation_response(content)
+            logger.info("Solution generated successfully")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error during generation: {e}")
+            return self._mock_generation(task)
+
     def generate_solution(
         self,
         query: str,
@@ -122,34 +173,64 @@ class OpenAIGenerator(BaseAgent):
         """
         logger.info(f"Generating solution with {self.model_name}")
 
-        # 1. Construct the Constraint Block
-        constraint_prompt = ""
-        if forbidden_strategies and len(forbidden_strategies) > 0:
-            constraint_prompt = "\n\nCRITICAL CONSTRAINTS - DO NOT USE THE FOLLOWING STRATEGIES:\n"
-            for strategy in forbidden_strategies:
-                constraint_prompt += f"- {strategy}\n"
-            constraint_prompt += "You MUST choose a fundamentally different algorithmic approach.\n"
+        full_prompt = self._build_solution_prompt(query, context, forbidden_strategies)
 
-        # 2. Build Full Prompt
-        full_prompt = f"""
-GOAL: Write Python code to solve the following problem.
-PROBLEM: {query}
+        # Call OpenAI API
+        try:
+            if self.client is None:
+                # Fallback for testing without API
+                logger.warning("Using mock generation (API not available)")
+                return f"# Mock solution for: {query}\npass"
 
-CONTEXT: {context if context else "None"}
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": full_prompt},
+                ],
+                temperature=self.config.get("temperature", 0.7),
+                max_tokens=self.config.get("max_tokens", 2000),
+            )
 
-{constraint_prompt}
+            content = response.choices[0].message.content
+            logger.info("Solution generated successfully")
+            return content
 
-OUTPUT: Return ONLY the Python code block.
-"""
+        except Exception as e:
+            logger.error(f"Error during generation: {e}")
+            return f"# Error generating solution: {e}\npass"
+
+    async def agenerate_solution(
+        self,
+        query: str,
+        context: str | None = None,
+        forbidden_strategies: list[str] | None = None,
+    ) -> str:
+        """
+        Async variant of generate_solution using the AsyncOpenAI client.
+
+        This allows multiple generation requests to be in flight concurrently,
+        overlapping network I/O instead of blocking on each call in turn.
+
+        Args:
+            query: The problem statement
+            context: Optional context string (e.g., previous failure feedback)
+            forbidden_strategies: List of strategies to avoid (e.g., ["recursive", "brute_force"])
+
+        Returns:
+            String containing the generated Python code
+        """
+        logger.info(f"Generating solution (async) with {self.model_name}")
+
+        full_prompt = self._build_solution_prompt(query, context, forbidden_strategies)
 
-        # 3. Call OpenAI API
         try:
-            if self.client is None:
+            if self.async_client is None:
                 # Fallback for testing without API
                 logger.warning("Using mock generation (API not available)")
                 return f"# Mock solution for: {query}\npass"
 
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model_name,
                 messages=[
                     {"role": "system", "content": self.system_prompt},
@@ -167,6 +248,33 @@ OUTPUT: Return ONLY the Python code block.
             logger.error(f"Error during generation: {e}")
             return f"# Error generating solution: {e}\npass"
 
+    def _build_solution_prompt(
+        self,
+        query: str,
+        context: str | None = None,
+        forbidden_strategies: list[str] | None = None,
+    ) -> str:
+        """Build the full prompt for generate_solution / agenerate_solution."""
+        # 1. Construct the Constraint Block
+        constraint_prompt = ""
+        if forbidden_strategies and len(forbidden_strategies) > 0:
+            constraint_prompt = "\n\nCRITICAL CONSTRAINTS - DO NOT USE THE FOLLOWING STRATEGIES:\n"
+            for strategy in forbidden_strategies:
+                constraint_prompt += f"- {strategy}\n"
+            constraint_prompt += "You MUST choose a fundamentally different algorithmic approach.\n"
+
+        # 2. Build Full Prompt
+        return f"""
+GOAL: Write Python code to solve the following problem.
+PROBLEM: {query}
+
+CONTEXT: {context if context else "None"}
+
+{constraint_prompt}
+
+OUTPUT: Return ONLY the Python code block.
+"""
+
     def verify(self, context: dict[str, Any]) -> VerificationResult:
         """
         Not implemented for Generator agent.
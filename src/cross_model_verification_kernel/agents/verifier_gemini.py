@@ -3,17 +3,27 @@ Gemini Verifier Agent - System 2 thinking.
 This agent uses Google Gemini models to perform adversarial verification.
 """
 
+import asyncio
 import logging
 import os
+import re
 from pathlib import Path
 from typing import Any
 
+from ..core.graph_memory import GraphMemory
 from ..core.types import GenerationResult, VerificationOutcome, VerificationResult
+from ..core.verification_cache import SemanticVerificationCache
 from ..tools.sandbox import SandboxExecutor
 from .base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+# Verdict keywords scanned for in the verifier's critique. A single compiled
+# case-insensitive alternation (longest keyword first) finds all of them in
+# one pass over the original response — no per-keyword substring scans and no
+# lowercased copy of a potentially multi-kilobyte string.
+_VERDICT_KEYWORDS_RE = re.compile(r"edge case|critical|logic|pass|fail|flaw|bug", re.IGNORECASE)
+
 
 class GeminiVerifier(BaseAgent):
     """
@@ -28,6 +38,7 @@ class GeminiVerifier(BaseAgent):
         model_name: str = "gemini-1.5-pro",
         api_key: str | None = None,
         enable_prosecutor_mode: bool = True,
+        enable_semantic_cache: bool = False,
         temperature: float = 0.0,
         **kwargs,
     ):
@@ -38,6 +49,13 @@ class GeminiVerifier(BaseAgent):
             model_name: Gemini model to use (default: gemini-1.5-pro)
             api_key: Google API key (if None, reads from environment)
             enable_prosecutor_mode: Enable hostile test generation (default: True)
+            enable_semantic_cache: Reuse verdicts for near-identical (task, solution)
+                pairs via embedding lookup. Off by default: inside the retry
+                loop a revised solution is usually near-identical to the failed
+                one it fixes, so a similarity cache would echo the stale verdict
+                instead of re-judging. Opt in only for replay runs that
+                re-evaluate previously judged candidates. No-op if the optional
+                sentence-transformers/faiss dependencies are missing.
             temperature: Temperature for model responses (default: 0.0)
             **kwargs: Additional parameters (max_tokens, etc.)
         """
@@ -49,6 +67,9 @@ class GeminiVerifier(BaseAgent):
         self.temperature = temperature
         self.enable_prosecutor_mode = enable_prosecutor_mode
         self.sandbox = SandboxExecutor() if enable_prosecutor_mode else None
+        self.semantic_cache = (
+            SemanticVerificationCache(model_name) if enable_semantic_cache else None
+        )
 
         # Load system prompt
         prompt_path = (
@@ -70,6 +91,11 @@ Rules:
 4. Output ONLY the python code for the attack script. No markdown, no explanations.
 """
 
+        # In-flight coalescer: concurrent averify calls for the same
+        # (task, solution) pair share one API request instead of each paying
+        # for a duplicate verdict (common during speculative fan-out)
+        self._inflight: dict[str, asyncio.Future] = {}
+
         # Initialize Gemini client (lazy import to avoid dependency issues)
         self.model = None
         self._initialize_client()
@@ -114,6 +140,14 @@ Rules:
         """
         logger.info(f"Verifying solution with {self.model_name}")
 
+        # Semantic cache: reuse the verdict for a near-identical pair
+        if self.semantic_cache:
+            cached = self.semantic_cache.lookup(
+                context.get("task", ""), context.get("solution", "")
+            )
+            if cached is not None:
+                return cached
+
         # Build verification prompt
         verification_prompt = self._build_verification_prompt(context)
 
@@ -141,22 +175,103 @@ Rules:
 
             # Prosecutor Mode: Generate and run hostile tests
             if self.enable_prosecutor_mode:
-                hostile_tests = self._generate_hostile_tests(context, content)
-                result.hostile_tests = hostile_tests
-
-                # Execute hostile tests in sandbox
-                if hostile_tests and self.sandbox:
-                    test_results = self._execute_hostile_tests(
-                        context.get("solution", ""), hostile_tests
-                    )
-                    result.hostile_test_results = test_results
-
-                    # Update verification outcome based on hostile test results
-                    if test_results.get("failures", 0) > 0:
-                        result.outcome = VerificationOutcome.FAIL
-                        result.critical_issues.append(
-                            f"Hostile tests failed: {test_results.get('failures', 0)} out of {len(hostile_tests)} tests"
-                        )
+                self._apply_prosecutor_mode(context, content, result)
+
+            if self.semantic_cache:
+                self.semantic_cache.store(
+                    context.get("task", ""), context.get("solution", ""), result
+                )
+
+            logger.info(f"Verification complete: {result.outcome}")
+            return result
+
+        except Exception as e:
+            logger.error(f"Error during verification: {e}")
+            return self._mock_verification()
+
+    async def averify(self, context: dict[str, Any]) -> VerificationResult:
+        """
+        Async variant of verify using generate_content_async.
+
+        Allows multiple verification requests to be in flight concurrently;
+        the sandboxed prosecutor step is offloaded to a worker thread so it
+        doesn't block the event loop. Concurrent calls for an identical
+        (task, solution) pair are coalesced: the first call issues the API
+        request and later duplicates await its result.
+
+        Args:
+            context: Same dictionary as verify (task, solution, explanation, test_cases)
+
+        Returns:
+            VerificationResult with detailed critique
+        """
+        key = GraphMemory.generate_state_hash(
+            context.get("task", ""), context.get("solution", ""), 0
+        )
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.info("Coalescing duplicate verification request")
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._averify_uncoalesced(context)
+        except BaseException:
+            # _averify_uncoalesced only raises on cancellation; wake any
+            # duplicate waiters rather than leaving them pending forever
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _averify_uncoalesced(self, context: dict[str, Any]) -> VerificationResult:
+        """Run one async verification (cache lookup, API call, prosecutor mode)."""
+        logger.info(f"Verifying solution (async) with {self.model_name}")
+
+        # Semantic cache: reuse the verdict for a near-identical pair
+        if self.semantic_cache:
+            cached = self.semantic_cache.lookup(
+                context.get("task", ""), context.get("solution", "")
+            )
+            if cached is not None:
+                return cached
+
+        verification_prompt = self._build_verification_prompt(context)
+
+        try:
+            if self.model is None:
+                # Fallback for testing without API
+                return self._mock_verification()
+
+            response = await self.model.generate_content_async(
+                verification_prompt,
+                generation_config={
+                    "temperature": self.config.get("temperature", 0.3),
+                    "max_output_tokens": self.config.get("max_tokens", 2000),
+                },
+            )
+
+            content = response.text
+
+            # Track token usage
+            self._record_token_usage(verification_prompt, content)
+
+            # Parse the verification response
+            result = self._parse_verification_response(content)
+
+            # Prosecutor Mode: hostile test generation + sandbox execution are
+            # synchronous (extra LLM call + subprocess), so run them off-loop
+            if self.enable_prosecutor_mode:
+                await asyncio.to_thread(self._apply_prosecutor_mode, context, content, result)
+
+            if self.semantic_cache:
+                self.semantic_cache.store(
+                    context.get("task", ""), context.get("solution", ""), result
+                )
 
             logger.info(f"Verification complete: {result.outcome}")
             return result
@@ -165,6 +280,32 @@ Rules:
             logger.error(f"Error during verification: {e}")
             return self._mock_verification()
 
+    def _apply_prosecutor_mode(
+        self, context: dict[str, Any], content: str, result: VerificationResult
+    ) -> None:
+        """
+        Generate and execute hostile tests, updating the result in place.
+
+        Args:
+            context: The verification context (task, solution, etc.)
+            content: The verifier's critique text
+            result: The VerificationResult to update with hostile test outcomes
+        """
+        hostile_tests = self._generate_hostile_tests(context, content)
+        result.hostile_tests = hostile_tests
+
+        # Execute hostile tests in sandbox
+        if hostile_tests and self.sandbox:
+            test_results = self._execute_hostile_tests(context.get("solution", ""), hostile_tests)
+            result.hostile_test_results = test_results
+
+            # Update verification outcome based on hostile test results
+            if test_results.get("failures", 0) > 0:
+                result.outcome = VerificationOutcome.FAIL
+                result.critical_issues.append(
+                    f"Hostile tests failed: {test_results.get('failures', 0)} out of {len(hostile_tests)} tests"
+                )
+
     def generate_hostile_test(self, code_to_check: str) -> str:
         """
         The Prosecutor Mode: Generates a test script designed to fail.
@@ -249,14 +390,16 @@ print(f'Result: {{result}}')
 
         This is a simplified parser - in production, you might use more sophisticated parsing.
         """
-        # Simple heuristic: look for keywords to determine outcome
-        content_lower = content.lower()
+        # Simple heuristic: look for keywords to determine outcome. All
+        # keywords are collected in a single case-insensitive pass over the
+        # response, then the outcome/issue checks become set-membership lookups.
+        hits = {match.group().lower() for match in _VERDICT_KEYWORDS_RE.finditer(content)}
 
         # Determine outcome
-        if "pass" in content_lower and "fail" not in content_lower:
+        if "pass" in hits and "fail" not in hits:
             outcome = VerificationOutcome.PASS
             confidence = 0.9
-        elif "fail" in content_lower:
+        elif "fail" in hits:
             outcome = VerificationOutcome.FAIL
             confidence = 0.8
         else:
@@ -268,11 +411,11 @@ print(f'Result: {{result}}')
         logic_flaws = []
         missing_edge_cases = []
 
-        if "critical" in content_lower or "bug" in content_lower:
+        if "critical" in hits or "bug" in hits:
             critical_issues.append("Issues detected in verification")
-        if "logic" in content_lower and "flaw" in content_lower:
+        if "logic" in hits and "flaw" in hits:
             logic_flaws.append("Logic flaws identified")
-        if "edge case" in content_lower:
+        if "edge case" in hits:
             missing_edge_cases.append("Edge cases need attention")
 
         return VerificationResult(
@@ -446,8 +589,6 @@ Generate the tests now:"""
         tests = []
 
         # Look for code blocks
-        import re
-
         code_blocks = re.findall(r"```python\n(.*?)```", response, re.DOTALL)
 
         for block in code_blocks:
@@ -471,8 +612,6 @@ Generate the tests now:"""
 
     def _extract_function_name(self, solution: str) -> str | None:
         """Extract the primary function name from the solution code."""
-        import re
-
         # Look for function definitions
         match = re.search(r"def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(", solution)
         if match:
@@ -3,8 +3,9 @@ Core module for the Cross-Model Verification Kernel.
 Contains the kernel logic, graph memory, and type definitions.
 """
 
+from typing import Any
+
 from .graph_memory import GraphMemory
-from .kernel import VerificationKernel
 from .types import (
     GenerationResult,
     KernelState,
@@ -14,6 +15,22 @@ from .types import (
     VerificationResult,
 )
 
+
+def __getattr__(name: str) -> Any:
+    """Lazy loading for VerificationKernel (PEP 562).
+
+    kernel.py imports the agent classes, which in turn import core.types
+    through this package; deferring the kernel import until first use keeps
+    that from becoming a circular import and spares type-only consumers the
+    cost of loading the agent stack.
+    """
+    if name == "VerificationKernel":
+        from .kernel import VerificationKernel
+
+        return VerificationKernel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "VerificationKernel",
     "GraphMemory",
@@ -5,14 +5,42 @@ This module manages a persistent state machine that prevents deadlocks and cache
 
 import hashlib
 import logging
+import re
+import time
+from collections import defaultdict
 from datetime import datetime
 from typing import Any
 
+from .trace_writer import TraceWriter
 from .types import Node, NodeStatus, VerificationOutcome, VerificationResult
 
+try:
+    import xxhash
+
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 logger = logging.getLogger(__name__)
 
 
+# Node IDs and state hashes are keyed dictionary lookups, not security
+# boundaries, so a fast non-cryptographic hash is sufficient. xxh3 is ~5-10x
+# faster than SHA-256 on short strings; blake2b with a short digest is the
+# stdlib fallback. Both are deterministic across runs (fixed seed of 0).
+if HAS_XXHASH:
+
+    def _fast_hash(content: str) -> str:
+        """Hash a string to a 16-char hex digest (xxh3, seed=0)."""
+        return xxhash.xxh3_64_hexdigest(content)
+
+else:
+
+    def _fast_hash(content: str) -> str:
+        """Hash a string to a 16-char hex digest (blake2b fallback)."""
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+
 class GraphMemory:
     """
     The Graph of Truth - a multi-dimensional state machine that:
@@ -21,8 +49,20 @@ class GraphMemory:
     3. Maintains relationships between verified solutions
     """
 
-    def __init__(self):
+    def __init__(self, trace_writer: TraceWriter | None = None):
+        """
+        Initialize the graph memory.
+
+        Args:
+            trace_writer: Optional buffered TraceWriter; when provided, node
+                creation and verification events are streamed to it (the
+                caller owns closing it at end-of-run)
+        """
+        self.trace_writer = trace_writer
         self.nodes: dict[str, Node] = {}
+        # Secondary index: status -> node IDs. Lets status queries touch only
+        # matching nodes instead of scanning every Node object in the graph.
+        self._by_status: defaultdict[NodeStatus, set[str]] = defaultdict(set)
         self.visited_states: set[str] = set()
         self.verified_cache: dict[str, str] = {}  # Problem hash -> Solution
 
@@ -40,24 +80,35 @@ class GraphMemory:
             content=content,
             status=NodeStatus.PENDING,
             parent_id=parent_id,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=time.time_ns(),
+            updated_at=time.time_ns(),
         )
 
+        if node_id in self.nodes:
+            # Same content re-created: drop the stale index entry first
+            self._by_status[self.nodes[node_id].status].discard(node_id)
         self.nodes[node_id] = node
+        self._by_status[NodeStatus.PENDING].add(node_id)
 
         # Update parent's children
         if parent_id and parent_id in self.nodes:
             self.nodes[parent_id].children_ids.append(node_id)
 
+        if self.trace_writer:
+            self.trace_writer.append(
+                {"type": "node_created", "node_id": node_id, "parent_id": parent_id}
+            )
+
         logger.info(f"Created node {node_id} with parent {parent_id}")
         return node
 
     def update_node_status(self, node_id: str, status: NodeStatus) -> None:
         """Update the status of a node."""
         if node_id in self.nodes:
+            self._by_status[self.nodes[node_id].status].discard(node_id)
+            self._by_status[status].add(node_id)
             self.nodes[node_id].status = status
-            self.nodes[node_id].updated_at = datetime.now()
+            self.nodes[node_id].updated_at = time.time_ns()
             logger.info(f"Updated node {node_id} status to {status}")
         else:
             logger.warning(f"Attempted to update non-existent node {node_id}")
@@ -66,7 +117,7 @@ class GraphMemory:
         """Add a verification result to a node."""
         if node_id in self.nodes:
             self.nodes[node_id].verification_results.append(result)
-            self.nodes[node_id].updated_at = datetime.now()
+            self.nodes[node_id].updated_at = time.time_ns()
 
             # Update status based on verification result
             if result.outcome == VerificationOutcome.PASS:
@@ -74,6 +125,16 @@ class GraphMemory:
             elif result.outcome == VerificationOutcome.FAIL:
                 self.update_node_status(node_id, NodeStatus.FAILED)
 
+            if self.trace_writer:
+                self.trace_writer.append(
+                    {
+                        "type": "verification_result",
+                        "node_id": node_id,
+                        "outcome": result.outcome.value,
+                        "confidence": result.confidence,
+                    }
+                )
+
             logger.info(f"Added verification result to node {node_id}: {result.outcome}")
         else:
             logger.warning(f"Attempted to add verification to non-existent node {node_id}")
@@ -85,7 +146,9 @@ class GraphMemory:
     def mark_state_visited(self, state_hash: str) -> None:
         """Mark a state as visited to prevent infinite loops."""
         self.visited_states.add(state_hash)
-        logger.debug(f"Marked state as visited: {state_hash}")
+        # Called every loop iteration: skip the f-string unless debug is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Marked state as visited: {state_hash}")
 
     def get_cached_solution(self, problem_hash: str) -> str | None:
         """Retrieve a cached solution for a problem."""
@@ -102,15 +165,16 @@ class GraphMemory:
 
     def get_verified_nodes(self) -> list[Node]:
         """Get all verified nodes."""
-        return [node for node in self.nodes.values() if node.is_verified()]
+        return [self.nodes[node_id] for node_id in self._by_status[NodeStatus.VERIFIED]]
 
     def get_failed_nodes(self) -> list[Node]:
         """Get all failed nodes."""
-        return [node for node in self.nodes.values() if node.status == NodeStatus.FAILED]
+        return [self.nodes[node_id] for node_id in self._by_status[NodeStatus.FAILED]]
 
     def clear(self) -> None:
         """Clear all graph state (for testing or reset)."""
         self.nodes.clear()
+        self._by_status.clear()
         self.visited_states.clear()
         self.verified_cache.clear()
         self.approach_failures.clear()
@@ -118,10 +182,27 @@ class GraphMemory:
         self.conversation_trace.clear()
         logger.info("Cleared graph memory")
 
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        Normalize a query for exact-match solution caching.
+
+        Problem strings that differ only by case or whitespace (trailing
+        newlines, double spaces, etc.) should hit the same cache entry, so
+        strip, collapse whitespace, and lowercase before hashing.
+
+        Args:
+            query: The raw problem statement
+
+        Returns:
+            The normalized query string
+        """
+        return re.sub(r"\s+", " ", query.strip().lower())
+
     @staticmethod
     def _generate_node_id(content: str) -> str:
         """Generate a unique ID for a node based on its content."""
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return _fast_hash(content)
 
     @staticmethod
     def generate_state_hash(task: str, solution: str, iteration: int) -> str:
@@ -131,15 +212,14 @@ class GraphMemory:
         but is not included in the hash to ensure identical task/solution
         pairs are treated as the same state for loop detection.
         """
-        state_str = f"{task}|{solution}"
-        return hashlib.sha256(state_str.encode()).hexdigest()
+        return _fast_hash(f"{task}|{solution}")
 
     def get_stats(self) -> dict:
         """Get statistics about the graph state."""
         return {
             "total_nodes": len(self.nodes),
-            "verified_nodes": len(self.get_verified_nodes()),
-            "failed_nodes": len(self.get_failed_nodes()),
+            "verified_nodes": len(self._by_status[NodeStatus.VERIFIED]),
+            "failed_nodes": len(self._by_status[NodeStatus.FAILED]),
             "visited_states": len(self.visited_states),
             "cached_solutions": len(self.verified_cache),
             "approach_failures": len(self.approach_failures),
@@ -169,8 +249,6 @@ class GraphMemory:
         solution_lower = solution.lower()
 
         # Check for recursion
-        import re
-
         function_match = re.search(r"def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(", solution)
         if function_match:
             function_name = function_match.group(1)
@@ -258,8 +336,6 @@ class GraphMemory:
         Args:
             entry: Dictionary containing conversation details
         """
-        from datetime import datetime
-
         entry["timestamp"] = datetime.now().isoformat()
         self.conversation_trace.append(entry)
         logger.debug(f"Added conversation entry: {entry.get('type', 'unknown')}")
@@ -271,29 +347,31 @@ class GraphMemory:
         Args:
             filepath: Path to save the trace
         """
-        import json
         from pathlib import Path
 
+        from .serialization import json_dumps_bytes
+
         output_path = Path(filepath)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, "w") as f:
-            json.dump(
-                {
-                    "trace": self.conversation_trace,
-                    "stats": self.get_stats(),
-                    "nodes": [
-                        {
-                            "id": node.id,
-                            "content": node.content[:200],  # Truncate for readability
-                            "status": node.status.value,
-                            "verification_count": len(node.verification_results),
-                        }
-                        for node in self.nodes.values()
-                    ],
-                },
-                f,
-                indent=2,
+        with open(output_path, "wb") as f:
+            f.write(
+                json_dumps_bytes(
+                    {
+                        "trace": self.conversation_trace,
+                        "stats": self.get_stats(),
+                        "nodes": [
+                            {
+                                "id": node.id,
+                                "content": node.content[:200],  # Truncate for readability
+                                "status": node.status.value,
+                                "verification_count": len(node.verification_results),
+                            }
+                            for node in self.nodes.values()
+                        ],
+                    },
+                    indent=True,
+                )
             )
 
         logger.info(f"Exported conversation trace to {filepath}")
@@ -5,8 +5,11 @@ This is the deterministic logic that manages the Generator -> Verifier -> Graph
 Core Philosophy: "Trust, but Verify (with a different brain)."
 """
 
+import asyncio
+import atexit
 import logging
 import random
+import time
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +18,7 @@ import yaml
 from ..agents.base_agent import BaseAgent
 from .graph_memory import GraphMemory
 from .trace_logger import TraceLogger
+from .trace_writer import TraceWriter
 from .types import (
     GenerationResult,
     KernelState,
@@ -82,7 +86,6 @@ class VerificationKernel:
         """
         self.generator = generator
         self.verifier = verifier
-        self.graph = GraphMemory()
         self.seed = seed
 
         # Set reproducibility seed if provided
@@ -92,6 +95,19 @@ class VerificationKernel:
         # Feature 3: Optional TraceLogger for research purposes
         self.trace_logger = TraceLogger() if enable_trace_logging else None
 
+        # Buffered per-event graph trace, streamed alongside the TraceLogger
+        # summaries; closed (flush + single fsync) via close() or at exit
+        self.trace_writer: TraceWriter | None = None
+        if enable_trace_logging:
+            trace_path = (
+                Path(self.trace_logger.log_dir)
+                / f"graph_events_{time.strftime('%Y%m%d-%H%M%S')}.jsonl"
+            )
+            self.trace_writer = TraceWriter(str(trace_path))
+            atexit.register(self.close)
+
+        self.graph = GraphMemory(trace_writer=self.trace_writer)
+
         # Load configuration
         self.config = self._load_config(config_path)
         self.max_loops = self.config.get("kernel", {}).get("max_loops", 5)
@@ -141,8 +157,9 @@ class VerificationKernel:
             }
         )
 
-        # Check cache first
-        problem_hash = GraphMemory.generate_state_hash(task, "", 0)
+        # Check cache first (normalized so whitespace/case variants of the
+        # same problem short-circuit to the stored answer)
+        problem_hash = GraphMemory.generate_state_hash(GraphMemory.normalize_query(task), "", 0)
         cached_solution = self.graph.get_cached_solution(problem_hash)
         if cached_solution:
             logger.info("Found cached solution")
@@ -230,6 +247,192 @@ class VerificationKernel:
         logger.info(f"Kernel execution complete. Success: {state.is_complete}")
         return state
 
+    async def execute_async(
+        self, task: str, context: dict[str, Any] | None = None, speculation: int = 2
+    ) -> KernelState:
+        """
+        Async verification loop with speculative generation.
+
+        Instead of blocking on one verifier response before issuing the next
+        generation, this scheduler keeps up to `speculation` candidates in
+        flight. As each generate+verify pipeline completes, the result is
+        harvested immediately (asyncio.wait FIRST_COMPLETED) and, on rejection,
+        a replacement candidate is launched against the accumulated feedback -
+        so the verifier never sits idle waiting for a straggler. The total
+        candidate budget stays at max_loops, preserving the cost semantics of
+        the synchronous execute.
+
+        Args:
+            task: The problem statement or task description
+            context: Optional additional context for the task
+            speculation: Number of candidates to keep in flight concurrently
+
+        Returns:
+            KernelState containing the final result and execution history
+        """
+        logger.info(f"Starting async kernel execution for task: {task[:100]}...")
+
+        state = KernelState(
+            task_description=task, current_loop=0, max_loops=self.max_loops, metadata=context or {}
+        )
+
+        self.graph.add_conversation_entry(
+            {
+                "type": "task_start",
+                "task": task,
+                "max_loops": self.max_loops,
+                "speculation": speculation,
+                "context": context or {},
+            }
+        )
+
+        # Check cache first (normalized so whitespace/case variants of the
+        # same problem short-circuit to the stored answer)
+        problem_hash = GraphMemory.generate_state_hash(GraphMemory.normalize_query(task), "", 0)
+        cached_solution = self.graph.get_cached_solution(problem_hash)
+        if cached_solution:
+            logger.info("Found cached solution")
+            state.final_result = cached_solution
+            state.is_complete = True
+            return state
+
+        async def run_candidate(index: int) -> tuple[GenerationResult, VerificationResult]:
+            """Generate one candidate and verify it."""
+            gen_context = self._build_generation_context(state)
+            gen_context["speculation_index"] = index
+            generation = await self.generator.agenerate(task, gen_context)
+            verification = await self.verifier.averify(
+                {
+                    "task": task,
+                    "solution": generation.solution,
+                    "explanation": generation.explanation,
+                    "test_cases": generation.test_cases,
+                }
+            )
+            return generation, verification
+
+        launched = min(max(speculation, 1), self.max_loops)
+        in_flight: set[asyncio.Task] = {
+            asyncio.create_task(run_candidate(i)) for i in range(launched)
+        }
+
+        while in_flight and not state.is_complete:
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+            for finished in done:
+                generation, verification = finished.result()
+                state.current_loop += 1
+
+                node = self.graph.create_node(content=generation.solution, parent_id=None)
+                state.verification_history.append(verification)
+                self.graph.add_verification_result(node.id, verification)
+
+                self.graph.add_conversation_entry(
+                    {
+                        "type": "verification",
+                        "loop": state.current_loop,
+                        "outcome": verification.outcome.value,
+                        "confidence": verification.confidence,
+                        "critical_issues": verification.critical_issues,
+                        "hostile_tests_count": (
+                            len(verification.hostile_tests) if verification.hostile_tests else 0
+                        ),
+                    }
+                )
+
+                if state.is_complete:
+                    # A sibling candidate was already accepted - this one is dominated
+                    self.graph.update_node_status(node.id, NodeStatus.FAILED)
+                    continue
+
+                state.current_solution = generation
+
+                # Duplicate candidates are retired without feedback; the refill
+                # below issues a fresh generation against the updated context
+                state_hash = GraphMemory.generate_state_hash(
+                    task, generation.solution, state.current_loop
+                )
+                revisited = self.graph.has_visited_state(state_hash)
+                self.graph.mark_state_visited(state_hash)
+
+                if not revisited and self._should_accept_solution(verification):
+                    logger.info("Solution accepted")
+                    state.is_complete = True
+                    state.final_result = generation.solution
+                    self.graph.cache_solution(problem_hash, generation.solution)
+                    self.graph.update_node_status(node.id, NodeStatus.VERIFIED)
+                    continue
+
+                logger.info("Solution rejected, refilling pipeline...")
+
+                # Feature 2: Record approach failure for lateral thinking
+                self.graph.record_approach_failure(generation.solution, task)
+                state.metadata["last_verification"] = verification
+
+                if self.graph.should_branch(generation.solution, task):
+                    forbidden_approaches = self.graph.get_forbidden_approaches(task)
+                    state.metadata["forbidden_approaches"] = forbidden_approaches
+                    logger.info(
+                        f"Branching required - forbidden approaches: {forbidden_approaches}"
+                    )
+
+                self.graph.update_node_status(node.id, NodeStatus.FAILED)
+
+                # Fire the next speculative generation immediately
+                if launched < self.max_loops:
+                    in_flight.add(asyncio.create_task(run_candidate(launched)))
+                    launched += 1
+
+        # Retire any stragglers once a result is settled
+        for pending in in_flight:
+            pending.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+        if not state.is_complete:
+            logger.warning("Max loops reached without verification")
+            state.is_complete = True
+            state.final_result = self._handle_max_loops_reached(state)
+
+        logger.info(f"Async kernel execution complete. Success: {state.is_complete}")
+        return state
+
+    async def execute_batch(
+        self,
+        tasks: list[str],
+        context: dict[str, Any] | None = None,
+        max_concurrency: int | None = None,
+        speculation: int = 2,
+    ) -> list[KernelState]:
+        """
+        Run the async verification loop over many tasks concurrently.
+
+        Tasks are fanned out with asyncio.gather, bounded by a semaphore so a
+        full benchmark (e.g. HumanEval's 164 problems) doesn't open hundreds
+        of provider requests at once. Results are returned in task order.
+
+        Args:
+            tasks: The problem statements to solve
+            context: Optional context shared by every task
+            max_concurrency: Maximum tasks in flight at once (default: the
+                kernel config's ``max_concurrency``, falling back to 4)
+            speculation: Candidates to keep in flight per task (see execute_async)
+
+        Returns:
+            List of KernelState results, one per task, in input order
+        """
+        if max_concurrency is None:
+            max_concurrency = self.config.get("kernel", {}).get("max_concurrency", 4)
+
+        logger.info(f"Starting batch execution: {len(tasks)} tasks, {max_concurrency} concurrent")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(task: str) -> KernelState:
+            async with semaphore:
+                return await self.execute_async(task, context, speculation=speculation)
+
+        return list(await asyncio.gather(*(run_one(task) for task in tasks)))
+
     def _generate_solution(self, task: str, state: KernelState) -> GenerationResult:
         """
         Call the Generator to produce a solution.
@@ -243,8 +446,34 @@ class VerificationKernel:
         """
         logger.debug("Calling generator...")
 
-        # Build context from previous iterations
-        context = {"iteration": state.current_loop, "previous_feedback": None}
+        context = self._build_generation_context(state)
+
+        result = self.generator.generate(task, context)
+
+        # Feature 3: Add generation to conversation trace
+        self.graph.add_conversation_entry(
+            {
+                "type": "generation",
+                "loop": state.current_loop,
+                "approach": self.graph.detect_approach(result.solution),
+                "solution_length": len(result.solution),
+                "forbidden_approaches": state.metadata.get("forbidden_approaches", []),
+            }
+        )
+
+        return result
+
+    def _build_generation_context(self, state: KernelState) -> dict[str, Any]:
+        """
+        Build the generator context from the current kernel state.
+
+        Args:
+            state: Current kernel state
+
+        Returns:
+            Context dictionary with iteration, feedback, and forbidden approaches
+        """
+        context: dict[str, Any] = {"iteration": state.current_loop, "previous_feedback": None}
 
         if state.verification_history:
             last_verification = state.verification_history[-1]
@@ -266,20 +495,7 @@ class VerificationKernel:
                     f"For example, if 'recursive' is forbidden, use an iterative solution instead."
                 )
 
-        result = self.generator.generate(task, context)
-
-        # Feature 3: Add generation to conversation trace
-        self.graph.add_conversation_entry(
-            {
-                "type": "generation",
-                "loop": state.current_loop,
-                "approach": self.graph.detect_approach(result.solution),
-                "solution_length": len(result.solution),
-                "forbidden_approaches": state.metadata.get("forbidden_approaches", []),
-            }
-        )
-
-        return result
+        return context
 
     def _verify_solution(self, solution: GenerationResult, task: str) -> VerificationResult:
         """
@@ -377,8 +593,20 @@ class VerificationKernel:
     def reset(self) -> None:
         """Reset the kernel state (for testing or new sessions)."""
         self.graph.clear()
+        if self.trace_writer:
+            self.trace_writer.flush()
         logger.info("Kernel reset complete")
 
+    def close(self) -> None:
+        """
+        Flush and close the buffered graph trace, if enabled.
+
+        Safe to call multiple times; also registered atexit so a run that
+        never calls it explicitly still gets its final buffer written.
+        """
+        if self.trace_writer:
+            self.trace_writer.close()
+
     def export_conversation_trace(self, filepath: str) -> None:
         """
         Export the conversation trace to a JSON file.
@@ -0,0 +1,47 @@
+"""
+JSON serialization helpers for trace output.
+
+Trace files can hold hundreds of verification nodes with long reasoning
+strings, making stdlib json.dumps a measurable pure-Python hot path. orjson
+(Rust implementation, ~5-10x faster) is used when installed and produces
+bytes directly; stdlib json is the fallback. Enum members (NodeStatus,
+VerificationOutcome) and datetimes are handled either way.
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    import json
+
+    HAS_ORJSON = False
+
+
+def _default(obj: Any) -> Any:
+    """Serialize values the JSON encoders don't handle natively."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+if HAS_ORJSON:
+
+    def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (orjson)."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=_default, option=option)
+
+else:
+
+    def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (stdlib fallback)."""
+        return json.dumps(
+            obj, default=_default, indent=2 if indent else None, ensure_ascii=False
+        ).encode()
@@ -7,12 +7,13 @@ the exact moment one model catches another's error and how it was fixed.
 """
 from __future__ import annotations
 
-import json
 import os
 import time
 from dataclasses import asdict
 from typing import TYPE_CHECKING
 
+from .serialization import json_dumps_bytes
+
 if TYPE_CHECKING:
     from .types import NodeState
 
@@ -68,8 +69,8 @@ class TraceLogger:
             ),
         }
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, "wb") as f:
+            f.write(json_dumps_bytes(data, indent=True))
 
         print(f"📝 Trace saved to: {filepath}")
         return filepath
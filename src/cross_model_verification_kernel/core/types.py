@@ -3,12 +3,22 @@ Data types for the Cross-Model Verification Kernel.
 These classes define the core data structures used throughout the system.
 """
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any
 
 
+def format_timestamp_ns(timestamp_ns: int) -> str:
+    """Render an epoch-nanosecond timestamp as an ISO-8601 string.
+
+    Node timestamps are stored as plain ints (time.time_ns) to keep graph
+    mutations cheap; call this only at serialization/display time.
+    """
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
 class NodeStatus(Enum):
     """Status of a node in the Graph of Truth."""
 
@@ -26,7 +36,7 @@ class VerificationOutcome(Enum):
     UNCERTAIN = "uncertain"
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of a verification check by the Adversary."""
 
@@ -48,7 +58,7 @@ class VerificationResult:
         return len(self.critical_issues) > 0 or len(self.logic_flaws) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of code generation by the Generator."""
 
@@ -60,7 +70,7 @@ class GenerationResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class Node:
     """A node in the Graph of Truth representing a piece of verified knowledge."""
 
@@ -69,8 +79,10 @@ class Node:
     status: NodeStatus
     verification_results: list[VerificationResult] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    # Epoch nanoseconds (time.time_ns): an int store instead of datetime
+    # construction per mutation; format with format_timestamp_ns when needed
+    created_at: int = field(default_factory=time.time_ns)
+    updated_at: int = field(default_factory=time.time_ns)
     parent_id: str | None = None
     children_ids: list[str] = field(default_factory=list)
 
@@ -90,7 +102,7 @@ class ExecutionTrace:
     strategy_used: str | None = None  # e.g. "recursive", "numpy", "brute_force"
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeState:
     """Tracks the state of a single problem-solving node."""
 
@@ -106,7 +118,7 @@ class NodeState:
         return len([t for t in self.history if t.status == "failed"])
 
 
-@dataclass
+@dataclass(slots=True)
 class KernelState:
     """Current state of the kernel execution."""
 
@@ -0,0 +1,204 @@
+"""
+Semantic Verification Cache: embedding-based memoization of verifier verdicts.
+
+Research runs replay the same problems with small code variations; re-judging
+a (task, solution) pair that is near-identical to one already verified wastes
+a 1-3s API round-trip. This cache embeds the pair with a sentence-transformers
+model, looks it up in a FAISS inner-product index, and returns the stored
+VerificationResult when cosine similarity exceeds the threshold - converting
+the API call into a sub-10ms vector lookup on hit.
+
+The heavy dependencies (sentence-transformers, faiss) are optional; when they
+are not installed the cache silently disables itself and every lookup misses.
+
+Intended for replay/ablation runs that re-judge previously seen candidates.
+Do not enable it inside an adversarial retry loop: a revised solution is
+usually near-identical to the failed attempt it fixes, so a similarity lookup
+would return the stale verdict instead of re-judging the fix.
+"""
+
+import atexit
+import copy
+import logging
+import pickle
+import re
+from pathlib import Path
+
+import numpy as np
+
+from .types import VerificationResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "logs/verification_cache"
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+class SemanticVerificationCache:
+    """
+    Embedding + cosine lookup over prior verifications.
+
+    On lookup, the (task, solution) pair is embedded and matched against the
+    index of previously verified pairs; a similarity >= threshold returns the
+    cached VerificationResult. On store, the new pair is added to the index.
+    Index vectors and results are persisted (numpy + pickle) keyed by the
+    verifier model name, so hit rates carry across runs.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            model_name: Verifier model name (used to key the persisted cache)
+            cache_dir: Directory for persisted index + results
+            similarity_threshold: Minimum cosine similarity for a cache hit
+        """
+        self.model_name = model_name
+        self.cache_dir = Path(cache_dir)
+        self.similarity_threshold = similarity_threshold
+
+        self.hits = 0
+        self.misses = 0
+
+        self._encoder = None
+        self._index = None
+        self._vectors: list[np.ndarray] = []
+        self._results: list[VerificationResult] = []
+
+        self._available = self._initialize()
+        if self._available:
+            self._load()
+            atexit.register(self.save)
+
+    def _initialize(self) -> bool:
+        """Set up the encoder and FAISS index (lazy optional imports)."""
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            logger.warning(
+                "sentence-transformers/faiss not installed - semantic cache disabled. "
+                "Install with: pip install sentence-transformers faiss-cpu"
+            )
+            return False
+
+        try:
+            self._encoder = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            dimension = self._encoder.get_sentence_embedding_dimension()
+            self._index = faiss.IndexFlatIP(dimension)
+            logger.info(f"Semantic verification cache initialized (dim={dimension})")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize semantic cache: {e}")
+            return False
+
+    def lookup(self, task: str, solution: str) -> VerificationResult | None:
+        """
+        Look up a prior verdict for a semantically similar (task, solution) pair.
+
+        Args:
+            task: The original problem statement
+            solution: The generated solution
+
+        Returns:
+            A copy of the cached VerificationResult on hit, or None on miss
+        """
+        if not self._available or self._index.ntotal == 0:
+            return None
+
+        query = self._embed(task, solution)
+        scores, indices = self._index.search(query, 1)
+        score, idx = float(scores[0][0]), int(indices[0][0])
+
+        if idx >= 0 and score >= self.similarity_threshold:
+            self.hits += 1
+            logger.info(f"Semantic cache hit (similarity={score:.3f})")
+            # Copy so callers can't mutate the stored verdict in place
+            return copy.deepcopy(self._results[idx])
+
+        self.misses += 1
+        return None
+
+    def store(self, task: str, solution: str, result: VerificationResult) -> None:
+        """
+        Add a fresh verdict to the cache.
+
+        Args:
+            task: The original problem statement
+            solution: The generated solution
+            result: The verifier's verdict for this pair
+        """
+        if not self._available:
+            return
+
+        vector = self._embed(task, solution)
+        self._index.add(vector)
+        self._vectors.append(vector[0])
+        # Copy for the same reason lookup copies: the caller keeps mutating
+        # its result object (e.g. prosecutor mode) after handing it to us
+        self._results.append(copy.deepcopy(result))
+
+    def save(self) -> None:
+        """Persist index vectors and results, keyed by model name."""
+        if not self._available or not self._results:
+            return
+
+        vectors_path, results_path = self._cache_paths()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        np.save(vectors_path, np.vstack(self._vectors))
+        with open(results_path, "wb") as f:
+            pickle.dump(self._results, f)
+
+        logger.info(f"Saved {len(self._results)} cached verifications to {self.cache_dir}")
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "available": self._available,
+            "entries": len(self._results),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+        }
+
+    def _load(self) -> None:
+        """Load a previously persisted cache for this model, if present."""
+        vectors_path, results_path = self._cache_paths()
+        if not (vectors_path.exists() and results_path.exists()):
+            return
+
+        try:
+            vectors = np.load(vectors_path)
+            with open(results_path, "rb") as f:
+                self._results = pickle.load(f)
+            self._vectors = list(vectors)
+            self._index.add(np.ascontiguousarray(vectors, dtype=np.float32))
+            logger.info(f"Loaded {len(self._results)} cached verifications for {self.model_name}")
+        except Exception as e:
+            logger.warning(f"Failed to load persisted semantic cache: {e}")
+            self._vectors = []
+            self._results = []
+
+    def _embed(self, task: str, solution: str) -> np.ndarray:
+        """Embed a (task, solution) pair as a normalized float32 row vector."""
+        embedding = self._encoder.encode(
+            [f"{task}\n{solution}"], convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.ascontiguousarray(embedding, dtype=np.float32)
+
+    def _cache_paths(self) -> tuple[Path, Path]:
+        """Build the (vectors, results) file paths for this model name."""
+        safe_name = re.sub(r"[^a-zA-Z0-9_.-]", "_", self.model_name)
+        return (
+            self.cache_dir / f"{safe_name}_vectors.npy",
+            self.cache_dir / f"{safe_name}_results.pkl",
+        )
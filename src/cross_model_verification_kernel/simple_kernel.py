@@ -7,8 +7,10 @@ for tracking and integrates with the TraceLogger for research purposes.
 
 from __future__ import annotations
 
+import asyncio
+
+from .agents import get_verifier
 from .agents.generator_openai import OpenAIGenerator
-from .agents.verifier_gemini import GeminiVerifier
 from .core.trace_logger import TraceLogger
 from .core.types import ExecutionTrace, NodeState
 
@@ -30,7 +32,9 @@ class SimpleVerificationKernel:
         """
         self.max_retries = max_retries
         self.generator = OpenAIGenerator()
-        self.verifier = GeminiVerifier()
+        # Shared across kernel instances: re-creating the verifier per problem
+        # would redo SDK configuration and model setup every time
+        self.verifier = get_verifier()
         self.logger = TraceLogger()  # Initialize Logger
 
     def solve(self, query: str, run_id: str = "experiment") -> str | None:
@@ -76,39 +80,64 @@ class SimpleVerificationKernel:
                 is_valid = False
                 feedback = f"Verification error: {str(e)}"
 
-            # 3. Record in History
-            strategy_used = self._detect_strategy(code)
-            trace = ExecutionTrace(
-                step_id=attempt + 1,
-                code_generated=code,
-                verifier_feedback=feedback,
-                status="success" if is_valid else "failed",
-                strategy_used=strategy_used,
+            # 3 & 4. Record in History and decide
+            if self._record_attempt(state, attempt, code, is_valid, feedback):
+                final_code = code
+                break
+
+        # --- FEATURE 3: SAVE TRACE ---
+        self.logger.save_trace(run_id, state)
+
+        if final_code:
+            return final_code
+        else:
+            print("💀 Max retries reached.")
+            return None
+
+    async def solve_async(self, query: str, run_id: str = "experiment") -> str | None:
+        """
+        Async variant of solve using the agents' async APIs.
+
+        The verification loop itself stays sequential (each attempt needs the
+        previous verdict), but using the async generator/verifier calls lets
+        multiple independent solve_async invocations run concurrently - e.g.
+        asyncio.gather over many problems in paper_data_generator.
+
+        Args:
+            query: The problem statement to solve
+            run_id: Identifier for this run (used in trace filename)
+
+        Returns:
+            str: The verified solution code, or None if max retries reached
+        """
+        state = NodeState(input_query=query)
+        print(f"🚀 Starting Kernel (async) for: {query}")
+
+        final_code = None
+
+        for attempt in range(self.max_retries):
+            print(f"\n🔄 Attempt {attempt + 1}/{self.max_retries}")
+
+            # 1. Generate Solution
+            code = await self.generator.agenerate_solution(
+                query=query,
+                context="Previous attempts failed. Try a different approach.",
+                forbidden_strategies=state.forbidden_strategies,
             )
-            state.history.append(trace)
 
-            # 4. Decision Logic
-            if is_valid:
-                print("✅ Verified! Solution found.")
-                state.current_code = code
-                state.status = "verified"
+            # 2. Verify Solution
+            try:
+                verification_result = await self._averify_code(code, query)
+                is_valid = verification_result.get("passed", False)
+                feedback = verification_result.get("feedback", "No feedback")
+            except Exception as e:
+                is_valid = False
+                feedback = f"Verification error: {str(e)}"
+
+            # 3 & 4. Record in History and decide
+            if self._record_attempt(state, attempt, code, is_valid, feedback):
                 final_code = code
                 break
-            else:
-                print(f"❌ Verification failed: {feedback}")
-                # Feature 2: Add to forbidden_strategies if failed multiple times
-                if strategy_used and strategy_used not in state.forbidden_strategies:
-                    # Ban strategy if it failed twice
-                    strategy_fail_count = sum(
-                        1
-                        for t in state.history
-                        if t.strategy_used == strategy_used and t.status == "failed"
-                    )
-                    if strategy_fail_count >= 2:
-                        state.forbidden_strategies.append(strategy_used)
-                        print(f"🚫 Banning strategy: {strategy_used}")
-
-                state.status = "rejected"
 
         # --- FEATURE 3: SAVE TRACE ---
         self.logger.save_trace(run_id, state)
@@ -119,6 +148,83 @@ class SimpleVerificationKernel:
             print("💀 Max retries reached.")
             return None
 
+    async def solve_batch(
+        self, queries: list[str], run_id: str = "experiment", max_concurrency: int = 4
+    ) -> list[str | None]:
+        """
+        Solve many queries concurrently via solve_async.
+
+        Each query still runs its own sequential retry loop, but the loops for
+        different queries overlap, bounded by a semaphore so provider rate
+        limits aren't tripped. Trace files are suffixed with the query index.
+
+        Args:
+            queries: The problem statements to solve
+            run_id: Base identifier for this run (per-query traces append an index)
+            max_concurrency: Maximum queries in flight at once (default: 4)
+
+        Returns:
+            List of solutions (or None for unsolved), one per query, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(index: int, query: str) -> str | None:
+            async with semaphore:
+                return await self.solve_async(query, run_id=f"{run_id}_{index:03d}")
+
+        return list(await asyncio.gather(*(run_one(i, query) for i, query in enumerate(queries))))
+
+    def _record_attempt(
+        self, state: NodeState, attempt: int, code: str, is_valid: bool, feedback: str
+    ) -> bool:
+        """
+        Record an attempt in the state history and apply the decision logic.
+
+        Implements the strategy-banning rule of Feature 2: a strategy that
+        failed twice is added to forbidden_strategies.
+
+        Args:
+            state: The NodeState being updated
+            attempt: Zero-based attempt index
+            code: The generated code for this attempt
+            is_valid: Whether verification passed
+            feedback: Verifier feedback text
+
+        Returns:
+            True if the solution was verified (caller should stop iterating)
+        """
+        strategy_used = self._detect_strategy(code)
+        trace = ExecutionTrace(
+            step_id=attempt + 1,
+            code_generated=code,
+            verifier_feedback=feedback,
+            status="success" if is_valid else "failed",
+            strategy_used=strategy_used,
+        )
+        state.history.append(trace)
+
+        if is_valid:
+            print("✅ Verified! Solution found.")
+            state.current_code = code
+            state.status = "verified"
+            return True
+
+        print(f"❌ Verification failed: {feedback}")
+        # Feature 2: Add to forbidden_strategies if failed multiple times
+        if strategy_used and strategy_used not in state.forbidden_strategies:
+            # Ban strategy if it failed twice
+            strategy_fail_count = sum(
+                1
+                for t in state.history
+                if t.strategy_used == strategy_used and t.status == "failed"
+            )
+            if strategy_fail_count >= 2:
+                state.forbidden_strategies.append(strategy_used)
+                print(f"🚫 Banning strategy: {strategy_used}")
+
+        state.status = "rejected"
+        return False
+
     def _verify_code(self, code: str, query: str) -> dict:
         """
         Verify the generated code.
@@ -148,6 +254,33 @@ class SimpleVerificationKernel:
         except Exception as e:
             return {"passed": False, "feedback": f"Verification error: {str(e)}"}
 
+    async def _averify_code(self, code: str, query: str) -> dict:
+        """
+        Async variant of _verify_code using the verifier's averify method.
+
+        Args:
+            code: The generated code
+            query: The original query
+
+        Returns:
+            dict: Verification result with 'passed' and 'feedback' keys
+        """
+        try:
+            context = {"task": query, "solution": code, "explanation": "", "test_cases": ""}
+            result = await self.verifier.averify(context)
+
+            from .core.types import VerificationOutcome
+
+            passed = result.outcome == VerificationOutcome.PASS and not result.has_critical_issues()
+
+            feedback = result.reasoning or "No specific feedback"
+            if result.critical_issues:
+                feedback += f"\nCritical Issues: {', '.join(result.critical_issues)}"
+
+            return {"passed": passed, "feedback": feedback}
+        except Exception as e:
+            return {"passed": False, "feedback": f"Verification error: {str(e)}"}
+
     def _detect_strategy(self, code: str) -> str | None:
         """
         Detect the algorithmic strategy used in the code.
@@ -310,6 +310,30 @@ class TestBatchVerification:
         with pytest.raises(ValueError, match="Length mismatch"):
             verify_embeddings_batch(embeddings_a, embeddings_b)
 
+    def test_batch_cosine_matches_per_pair_path(self):
+        """Vectorized cosine fast path should match per-pair verify_embeddings."""
+        rng = np.random.default_rng(42)
+        embeddings_a = [rng.normal(size=16) for _ in range(8)] + [np.zeros(16)]
+        embeddings_b = [rng.normal(size=16) for _ in range(8)] + [np.ones(16)]
+
+        batch_scores = verify_embeddings_batch(embeddings_a, embeddings_b)
+
+        for vec_a, vec_b, batch_score in zip(embeddings_a, embeddings_b, batch_scores, strict=True):
+            single = verify_embeddings(vec_a, vec_b)
+            assert batch_score.drift_score == pytest.approx(single.drift_score, nan_ok=True)
+            assert batch_score.confidence == pytest.approx(single.confidence)
+            assert batch_score.details["metric"] == single.details["metric"]
+
+    def test_batch_ragged_shapes_fall_back(self):
+        """Pairs with mismatched dimensions should still verify per pair."""
+        embeddings_a = [np.array([1.0, 0.0]), np.array([1.0, 0.0, 0.0])]
+        embeddings_b = [np.array([1.0, 0.0]), np.array([1.0, 0.0, 0.0])]
+
+        scores = verify_embeddings_batch(embeddings_a, embeddings_b)
+
+        assert len(scores) == 2
+        assert all(s.drift_score == pytest.approx(0.0, abs=0.01) for s in scores)
+
     def test_aggregate_embedding_scores(self):
         """Should aggregate batch results with statistics."""
         embeddings_a = [
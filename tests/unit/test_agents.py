@@ -60,5 +60,46 @@ class TestBaseAgent:
         assert result.confidence == 0.9
 
 
+class TestGetVerifier:
+    """Tests for the shared verifier factory."""
+
+    def setup_method(self):
+        from cross_model_verification_kernel import agents
+
+        agents._verifier_cache.clear()
+
+    def test_same_arguments_share_an_instance(self):
+        """Repeated calls with the same model and key reuse one verifier."""
+        from cross_model_verification_kernel.agents import get_verifier
+
+        first = get_verifier(api_key="test-key")
+        second = get_verifier(api_key="test-key")
+
+        assert first is second
+
+    def test_distinct_arguments_get_distinct_instances(self):
+        """A different model or key produces a separate verifier."""
+        from cross_model_verification_kernel.agents import get_verifier
+
+        base = get_verifier(api_key="test-key")
+
+        assert get_verifier(model_name="gemini-1.5-flash", api_key="test-key") is not base
+        assert get_verifier(api_key="other-key") is not base
+
+    def test_raw_key_never_appears_in_cache(self):
+        """Cache keys hold a digest, not the credential itself."""
+        from cross_model_verification_kernel import agents
+
+        agents.get_verifier(api_key="super-secret-key")
+
+        assert "super-secret-key" not in repr(agents._verifier_cache)
+
+    def test_simple_kernels_share_a_verifier(self):
+        """Two SimpleVerificationKernel instances reuse the same verifier."""
+        from cross_model_verification_kernel.simple_kernel import SimpleVerificationKernel
+
+        assert SimpleVerificationKernel().verifier is SimpleVerificationKernel().verifier
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,148 @@
+"""
+Unit tests for the async kernel paths (execute_async, batching).
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cross_model_verification_kernel.agents.base_agent import BaseAgent
+from cross_model_verification_kernel.core.kernel import VerificationKernel
+from cross_model_verification_kernel.core.types import (
+    GenerationResult,
+    VerificationOutcome,
+    VerificationResult,
+)
+
+
+class CountingGenerator(BaseAgent):
+    """Generator stub that produces a distinct solution per call."""
+
+    def __init__(self):
+        super().__init__("stub-generator", "stub-key")
+        self.calls = 0
+
+    def generate(self, task, _context=None):
+        self.calls += 1
+        return GenerationResult(
+            solution=f"def solve():  # attempt {self.calls} for {task}\n    return 1",
+            explanation="stub",
+            test_cases="",
+        )
+
+    def verify(self, context):
+        raise NotImplementedError()
+
+
+class PassingVerifier(BaseAgent):
+    """Verifier stub that accepts everything with high confidence."""
+
+    def __init__(self):
+        super().__init__("stub-verifier", "stub-key")
+
+    def generate(self, task, context=None):
+        raise NotImplementedError()
+
+    def verify(self, _context):
+        return VerificationResult(outcome=VerificationOutcome.PASS, confidence=0.95)
+
+
+class FailingVerifier(BaseAgent):
+    """Verifier stub that rejects everything."""
+
+    def __init__(self):
+        super().__init__("stub-verifier", "stub-key")
+
+    def generate(self, task, context=None):
+        raise NotImplementedError()
+
+    def verify(self, _context):
+        return VerificationResult(
+            outcome=VerificationOutcome.FAIL, confidence=0.9, reasoning="rejected"
+        )
+
+
+class TestExecuteAsync:
+    """Tests for the speculative async verification loop."""
+
+    def test_accepts_passing_solution(self):
+        """A passing candidate completes the state with its solution."""
+        kernel = VerificationKernel(CountingGenerator(), PassingVerifier())
+        state = asyncio.run(kernel.execute_async("some task"))
+
+        assert state.is_complete
+        assert "def solve()" in state.final_result
+        assert state.verification_history
+
+    def test_rejections_stop_at_max_loops(self):
+        """Persistent rejections exhaust the candidate budget, not more."""
+        generator = CountingGenerator()
+        kernel = VerificationKernel(generator, FailingVerifier())
+        state = asyncio.run(kernel.execute_async("some task", speculation=2))
+
+        assert state.is_complete
+        assert state.final_result.startswith("[MAX ITERATIONS]")
+        assert generator.calls <= kernel.max_loops
+
+    def test_cached_solution_short_circuits(self):
+        """A second run of the same task reuses the cached verified solution."""
+        kernel = VerificationKernel(CountingGenerator(), PassingVerifier())
+        first = asyncio.run(kernel.execute_async("some task"))
+        second = asyncio.run(kernel.execute_async("  SOME   task "))
+
+        assert second.final_result == first.final_result
+        assert second.current_loop == 0
+
+
+class TestExecuteBatch:
+    """Tests for concurrent batched execution."""
+
+    def test_batch_completes_all_states_in_order(self):
+        """A 3-task batch returns one completed state per task, in input order."""
+        kernel = VerificationKernel(CountingGenerator(), PassingVerifier())
+        tasks = ["task alpha", "task beta", "task gamma"]
+        states = asyncio.run(kernel.execute_batch(tasks, max_concurrency=2))
+
+        assert len(states) == len(tasks)
+        for task, state in zip(tasks, states, strict=True):
+            assert state.task_description == task
+            assert state.is_complete
+            assert task in state.final_result
+
+    def test_batch_of_nothing_is_empty(self):
+        """An empty batch completes without touching the agents."""
+        generator = CountingGenerator()
+        kernel = VerificationKernel(generator, PassingVerifier())
+        states = asyncio.run(kernel.execute_batch([]))
+
+        assert states == []
+        assert generator.calls == 0
+
+
+class TestSolveBatch:
+    """Tests for SimpleVerificationKernel.solve_batch (mock mode)."""
+
+    def test_solve_batch_returns_solution_per_query(self, tmp_path):
+        """Each query gets a solution and an index-suffixed trace file."""
+        from cross_model_verification_kernel.core.trace_logger import TraceLogger
+        from cross_model_verification_kernel.simple_kernel import SimpleVerificationKernel
+
+        kernel = SimpleVerificationKernel(max_retries=2)
+        kernel.logger = TraceLogger(str(tmp_path))
+
+        queries = ["reverse a string", "sum a list"]
+        solutions = asyncio.run(kernel.solve_batch(queries, run_id="batch"))
+
+        assert len(solutions) == len(queries)
+        assert all(solution is not None for solution in solutions)
+        for index in range(len(queries)):
+            assert list(tmp_path.glob(f"batch_{index:03d}_*.json"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,76 @@
+"""
+Unit tests for in-flight verification request coalescing in GeminiVerifier.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cross_model_verification_kernel.agents.verifier_gemini import GeminiVerifier
+from cross_model_verification_kernel.core.types import VerificationOutcome, VerificationResult
+
+
+def make_verifier(call_log):
+    """Build a verifier whose underlying verification call just logs and passes."""
+    verifier = GeminiVerifier(api_key="test-key", enable_prosecutor_mode=False)
+
+    async def fake_uncoalesced(context):
+        call_log.append(context["task"])
+        await asyncio.sleep(0.01)  # keep the request "in flight" briefly
+        return VerificationResult(outcome=VerificationOutcome.PASS, confidence=0.9)
+
+    verifier._averify_uncoalesced = fake_uncoalesced
+    return verifier
+
+
+class TestInFlightCoalescing:
+    """Tests for duplicate-request coalescing in averify."""
+
+    def test_concurrent_duplicates_share_one_request(self):
+        """Five concurrent identical contexts produce a single upstream call."""
+        calls = []
+        verifier = make_verifier(calls)
+        context = {"task": "some task", "solution": "some solution"}
+
+        async def run():
+            return await asyncio.gather(*(verifier.averify(dict(context)) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(r.outcome == VerificationOutcome.PASS for r in results)
+
+    def test_distinct_contexts_are_not_coalesced(self):
+        """Different (task, solution) pairs each get their own request."""
+        calls = []
+        verifier = make_verifier(calls)
+
+        async def run():
+            await asyncio.gather(
+                verifier.averify({"task": "task a", "solution": "s"}),
+                verifier.averify({"task": "task b", "solution": "s"}),
+            )
+
+        asyncio.run(run())
+        assert sorted(calls) == ["task a", "task b"]
+
+    def test_sequential_repeats_issue_fresh_requests(self):
+        """Coalescing only spans in-flight requests, not completed ones."""
+        calls = []
+        verifier = make_verifier(calls)
+        context = {"task": "some task", "solution": "some solution"}
+
+        asyncio.run(verifier.averify(dict(context)))
+        asyncio.run(verifier.averify(dict(context)))
+
+        assert len(calls) == 2
+        assert not verifier._inflight
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -99,6 +99,22 @@ class TestGraphMemory:
         assert len(graph.visited_states) == 0
         assert len(graph.verified_cache) == 0
 
+    def test_normalize_query(self):
+        """Test case and whitespace normalization for cache lookups."""
+        assert GraphMemory.normalize_query("  Reverse   a\nString\t") == "reverse a string"
+        assert GraphMemory.normalize_query("reverse a string") == "reverse a string"
+
+    def test_query_variants_share_a_state_hash(self):
+        """Test that whitespace/case variants hash to the same cache key."""
+        first = GraphMemory.generate_state_hash(
+            GraphMemory.normalize_query("Reverse a string"), "", 0
+        )
+        second = GraphMemory.generate_state_hash(
+            GraphMemory.normalize_query("  reverse   A STRING "), "", 0
+        )
+
+        assert first == second
+
 
 class TestTypes:
     """Tests for data types."""
@@ -0,0 +1,57 @@
+"""
+Unit tests for the JSON serialization helpers used by trace output.
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cross_model_verification_kernel.core.serialization import json_dumps_bytes
+from cross_model_verification_kernel.core.types import NodeStatus, VerificationOutcome
+
+
+class TestJsonDumpsBytes:
+    """Tests for json_dumps_bytes (orjson or stdlib fallback)."""
+
+    def test_round_trips_plain_data(self):
+        """Serialized output is UTF-8 JSON bytes that json.loads can read back."""
+        payload = {"nodes": [1, 2, 3], "score": 0.85, "label": "pénalité"}
+        data = json_dumps_bytes(payload)
+
+        assert isinstance(data, bytes)
+        assert json.loads(data) == payload
+
+    def test_enums_serialize_to_values(self):
+        """NodeStatus and VerificationOutcome members become their values."""
+        data = json_dumps_bytes(
+            {"status": NodeStatus.VERIFIED, "outcome": VerificationOutcome.PASS}
+        )
+
+        assert json.loads(data) == {"status": "verified", "outcome": "pass"}
+
+    def test_datetimes_serialize_to_isoformat(self):
+        """datetime values become ISO-8601 strings."""
+        moment = datetime(2025, 1, 2, 3, 4, 5)
+        data = json_dumps_bytes({"created": moment})
+
+        assert json.loads(data) == {"created": moment.isoformat()}
+
+    def test_indent_flag_produces_readable_output(self):
+        """indent=True pretty-prints without changing the parsed content."""
+        payload = {"a": 1, "b": [2, 3]}
+        compact = json_dumps_bytes(payload)
+        pretty = json_dumps_bytes(payload, indent=True)
+
+        assert json.loads(pretty) == json.loads(compact)
+        assert b"\n" in pretty
+        assert b"\n" not in compact
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,123 @@
+"""
+Unit tests for the buffered trace writer and its graph/kernel wiring.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cross_model_verification_kernel.core.graph_memory import GraphMemory
+from cross_model_verification_kernel.core.trace_writer import TraceWriter
+from cross_model_verification_kernel.core.types import (
+    NodeStatus,
+    VerificationOutcome,
+    VerificationResult,
+)
+
+
+def read_events(filepath):
+    """Read a JSONL trace file back as a list of dicts."""
+    with open(filepath) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestTraceWriter:
+    """Tests for TraceWriter buffering behavior."""
+
+    def test_buffers_until_flush(self, tmp_path):
+        """Events below the threshold stay in memory until flush/close."""
+        filepath = tmp_path / "trace.jsonl"
+        writer = TraceWriter(str(filepath))
+
+        writer.append({"type": "node_created", "node_id": "abc"})
+        assert not filepath.exists()
+
+        writer.close()
+        assert read_events(filepath) == [{"type": "node_created", "node_id": "abc"}]
+
+    def test_flushes_when_threshold_crossed(self, tmp_path):
+        """Crossing the byte threshold triggers a write without close()."""
+        filepath = tmp_path / "trace.jsonl"
+        writer = TraceWriter(str(filepath), flush_threshold=64)
+
+        for i in range(10):
+            writer.append({"type": "node_created", "node_id": f"node_{i}"})
+
+        assert filepath.exists()
+        writer.close()
+        assert len(read_events(filepath)) == 10
+
+    def test_context_manager_closes(self, tmp_path):
+        """The context manager flushes the remainder on exit."""
+        filepath = tmp_path / "trace.jsonl"
+        with TraceWriter(str(filepath)) as writer:
+            writer.append({"type": "node_created"})
+        assert len(read_events(filepath)) == 1
+
+
+class TestGraphMemoryTraceStream:
+    """Tests for GraphMemory streaming events into a TraceWriter."""
+
+    def test_graph_events_are_streamed(self, tmp_path):
+        """Node creation and verification results produce trace events."""
+        filepath = tmp_path / "graph.jsonl"
+        with TraceWriter(str(filepath)) as writer:
+            graph = GraphMemory(trace_writer=writer)
+            node = graph.create_node("some solution")
+            graph.add_verification_result(
+                node.id,
+                VerificationResult(outcome=VerificationOutcome.PASS, confidence=0.9),
+            )
+
+        events = read_events(filepath)
+        assert [e["type"] for e in events] == ["node_created", "verification_result"]
+        assert events[0]["node_id"] == node.id
+        assert events[1]["outcome"] == "pass"
+        assert graph.nodes[node.id].status == NodeStatus.VERIFIED
+
+
+class TestKernelTraceWiring:
+    """Tests for VerificationKernel owning a TraceWriter when tracing."""
+
+    def test_kernel_streams_graph_events(self, tmp_path, monkeypatch):
+        """With enable_trace_logging, graph events land in a JSONL file."""
+        monkeypatch.chdir(tmp_path)
+
+        from cross_model_verification_kernel.core.kernel import VerificationKernel
+        from tests.unit.test_agents import MockGenerator, MockVerifier
+
+        kernel = VerificationKernel(
+            generator=MockGenerator("gen", "key"),
+            verifier=MockVerifier("ver", "key"),
+            enable_trace_logging=True,
+        )
+        assert kernel.graph.trace_writer is kernel.trace_writer
+
+        state = kernel.execute("write a function")
+        assert state.is_complete
+        kernel.close()
+
+        events = read_events(kernel.trace_writer.filepath)
+        assert any(e["type"] == "node_created" for e in events)
+        assert any(e["type"] == "verification_result" for e in events)
+
+    def test_kernel_without_tracing_has_no_writer(self):
+        """The default kernel keeps the bare in-memory graph."""
+        from cross_model_verification_kernel.core.kernel import VerificationKernel
+        from tests.unit.test_agents import MockGenerator, MockVerifier
+
+        kernel = VerificationKernel(
+            generator=MockGenerator("gen", "key"),
+            verifier=MockVerifier("ver", "key"),
+        )
+        assert kernel.trace_writer is None
+        assert kernel.graph.trace_writer is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,88 @@
+"""
+Unit tests for the semantic verification cache.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cross_model_verification_kernel.agents.verifier_gemini import GeminiVerifier
+from cross_model_verification_kernel.core.types import VerificationOutcome, VerificationResult
+from cross_model_verification_kernel.core.verification_cache import SemanticVerificationCache
+
+
+def make_result():
+    """Build a simple PASS verdict for cache tests."""
+    return VerificationResult(
+        outcome=VerificationOutcome.PASS,
+        confidence=0.9,
+        critical_issues=["issue"],
+        reasoning="cached verdict",
+    )
+
+
+class FakeIndex:
+    """Minimal stand-in for a FAISS index holding one entry."""
+
+    ntotal = 1
+
+    def search(self, _query, _k):
+        return np.array([[0.99]]), np.array([[0]])
+
+
+class TestSemanticVerificationCache:
+    """Tests for SemanticVerificationCache."""
+
+    def test_disabled_cache_misses_and_ignores_stores(self, tmp_path):
+        """Without the optional deps the cache must be a silent no-op."""
+        cache = SemanticVerificationCache("test-model", cache_dir=str(tmp_path))
+        if cache._available:
+            pytest.skip("optional embedding deps installed - disabled path not reachable")
+
+        assert cache.lookup("task", "solution") is None
+        cache.store("task", "solution", make_result())  # must not raise
+        assert cache.lookup("task", "solution") is None
+
+        stats = cache.get_stats()
+        assert stats["available"] is False
+        assert stats["entries"] == 0
+
+    def test_lookup_returns_a_copy(self, tmp_path):
+        """Callers must not be able to mutate the stored verdict in place."""
+        cache = SemanticVerificationCache("test-model", cache_dir=str(tmp_path))
+
+        # Simulate an available cache holding one entry, without the heavy deps
+        cache._available = True
+        cache._index = FakeIndex()
+        cache._embed = lambda _task, _solution: np.zeros((1, 4), dtype=np.float32)
+        cache._results = [make_result()]
+
+        hit = cache.lookup("task", "solution")
+        assert hit is not None
+        assert hit is not cache._results[0]
+
+        hit.critical_issues.append("mutated by caller")
+        assert cache._results[0].critical_issues == ["issue"]
+
+
+class TestVerifierCacheDefault:
+    """Tests for the semantic cache being opt-in on GeminiVerifier."""
+
+    def test_semantic_cache_off_by_default(self):
+        """The retry loop must re-judge revised solutions, not replay verdicts."""
+        verifier = GeminiVerifier(enable_prosecutor_mode=False)
+        assert verifier.semantic_cache is None
+
+    def test_semantic_cache_opt_in(self):
+        """Replay runs can still opt in explicitly."""
+        verifier = GeminiVerifier(enable_prosecutor_mode=False, enable_semantic_cache=True)
+        assert isinstance(verifier.semantic_cache, SemanticVerificationCache)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])